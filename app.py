@@ -9,6 +9,7 @@ import requests
 from github import Github, GithubException
 import openai
 import base64
+from llm_generator import LLMAppGenerator as RoutedAppGenerator
 
 app = Flask(__name__)
 
@@ -105,16 +106,10 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE."""
 
-class LLMAppGenerator:
-    def __init__(self):
-        if Config.OPENAI_API_KEY:
-            openai.api_key = Config.OPENAI_API_KEY
-    
-    def generate_app(self, brief, attachments, checks):
-        """Generate complete application based on brief"""
-        print(f"🤖 Generating app for: {brief[:50]}...")
-        
-        # Create a simple app based on the brief
+class LLMAppGenerator(RoutedAppGenerator):
+    # generate_app routes the brief to a model tier and falls back to this app
+    def _get_demo_app(self, brief):
+        """Use the simple app as the fallback"""
         return self._create_simple_app(brief)
     
     def _create_simple_app(self, brief):
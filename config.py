@@ -1,5 +1,16 @@
 import os
 
+def _env_number(name, default, cast=float):
+    """Read a numeric environment variable, keeping the default if it is malformed"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        print(f"⚠️ Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
 class Config:
     # GitHub Configuration
     GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', 'your_github_token_here')
@@ -13,5 +24,21 @@ class Config:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', 'your_openai_key_here')
     LLM_MODEL = "gpt-3.5-turbo"
     
+    # LLM Model Routing
+    LLM_MODEL_TIERS = {
+        "fast": os.getenv('LLM_FAST_MODEL', LLM_MODEL),
+        "capable": os.getenv('LLM_CAPABLE_MODEL', 'gpt-4')
+    }
+    LLM_COMPLEXITY_THRESHOLD = _env_number('LLM_COMPLEXITY_THRESHOLD', 5.0)
+    LLM_HEALTH_WINDOW = _env_number('LLM_HEALTH_WINDOW', 20, int)
+    LLM_MAX_ERROR_RATE = _env_number('LLM_MAX_ERROR_RATE', 0.5)
+    LLM_MAX_LATENCY = {
+        "fast": _env_number('LLM_FAST_MAX_LATENCY', 60.0),
+        "capable": _env_number('LLM_CAPABLE_MAX_LATENCY', 100.0)
+    }
+    LLM_HEALTH_MIN_CALLS = _env_number('LLM_HEALTH_MIN_CALLS', 3, int)
+    LLM_HEALTH_TTL = _env_number('LLM_HEALTH_TTL', 300.0)
+    LLM_ATTACHMENT_PREVIEW_CHARS = _env_number('LLM_ATTACHMENT_PREVIEW_CHARS', 2000, int)
+    
     # App Configuration
     MAX_BUILD_TIME = 600
@@ -2,19 +2,106 @@ import openai
 import json
 import base64
 import os
+from config import Config
+from model_router import model_router, ModelOutputError
 
 class LLMAppGenerator:
-    def __init__(self):
+    def __init__(self, router=None):
         openai.api_key = os.getenv('OPENAI_API_KEY')
+        self.router = router or model_router
     
     def generate_app(self, brief, attachments, checks):
         """Generate complete application based on brief"""
         print("🤖 Generating app with LLM...")
         
-        # For demo purposes, return a simple counter app
-        # In production, you'd use the actual OpenAI API
+        # Without an API key, return a simple counter app for demo purposes
+        if not openai.api_key:
+            return self._get_demo_app(brief)
+        
+        for model in self.router.route(brief, attachments, checks):
+            try:
+                return self.router.timed_call(
+                    model, lambda m: self._request_app(m, brief, attachments, checks)
+                )
+            except Exception as e:
+                print(f"⚠️ {model} failed: {e}")
+        
+        print("❌ All models failed, falling back to demo app")
         return self._get_demo_app(brief)
     
+    def _request_app(self, model, brief, attachments, checks):
+        """Ask the given model for the app files as JSON"""
+        prompt = f"""Build a single-page static web app for GitHub Pages.
+
+Brief: {brief}
+
+Attachments:
+{self._describe_attachments(attachments)}
+
+Checks the app must pass:
+{json.dumps(checks, indent=2)}
+
+Respond with JSON only: {{"files": {{"index.html": "...", "README.md": "..."}}, "explanation": "..."}}"""
+        
+        response = openai.ChatCompletion.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            request_timeout=120
+        )
+        app = self._parse_app_json(response.choices[0].message.content)
+        app.setdefault("explanation", f"Generated with {model}")
+        return app
+    
+    def _describe_attachments(self, attachments):
+        """Summarise attachments for the prompt, with a preview of text content"""
+        if not attachments:
+            return "None"
+        
+        limit = Config.LLM_ATTACHMENT_PREVIEW_CHARS
+        descriptions = []
+        for attachment in attachments:
+            if not isinstance(attachment, dict):
+                continue
+            name = attachment.get("name", "attachment")
+            url = attachment.get("url", "")
+            
+            if not url.startswith("data:") or "," not in url:
+                descriptions.append(f"- {name}: {url}")
+                continue
+            
+            header, data = url[5:].split(",", 1)
+            mime_type = header.split(";")[0] or "text/plain"
+            try:
+                content = base64.b64decode(data, validate=True) if ";base64" in header else data.encode()
+            except ValueError:
+                descriptions.append(f"- {name} ({mime_type}): could not be decoded")
+                continue
+            
+            if mime_type.startswith("text/") or mime_type in ("application/json", "application/xml"):
+                text = content.decode("utf-8", errors="replace")
+                if len(text) > limit:
+                    text = text[:limit] + f"\n... ({len(text) - limit} more characters)"
+                descriptions.append(f"- {name} ({mime_type}):\n{text}")
+            else:
+                descriptions.append(f"- {name} ({mime_type}, {len(content)} bytes, not shown)")
+        return "\n".join(descriptions) or "None"
+    
+    def _parse_app_json(self, content):
+        """Extract the app JSON from a reply, tolerating markdown fences or extra prose"""
+        start = content.find("{")
+        end = content.rfind("}")
+        if start == -1 or end < start:
+            raise ModelOutputError("Response contains no JSON object")
+        
+        try:
+            app = json.loads(content[start:end + 1])
+        except json.JSONDecodeError as e:
+            raise ModelOutputError(f"Response is not valid JSON: {e}")
+        
+        if not isinstance(app, dict) or not isinstance(app.get("files"), dict) or "index.html" not in app["files"]:
+            raise ModelOutputError("Response is missing index.html")
+        return app
+    
     def _get_demo_app(self, brief):
         """Provide a demo app for testing"""
         return {
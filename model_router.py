@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import deque
+from config import Config
+
+class ModelOutputError(ValueError):
+    """Raised when a model responds but its output cannot be used"""
+
+class ModelRouter:
+    def __init__(self, tiers=None, threshold=None, window=None,
+                 max_error_rate=None, max_latency=None, min_calls=None,
+                 sample_ttl=None, clock=time.time):
+        self.tiers = tiers or Config.LLM_MODEL_TIERS
+        self.threshold = threshold if threshold is not None else Config.LLM_COMPLEXITY_THRESHOLD
+        self.window = window or Config.LLM_HEALTH_WINDOW
+        self.max_error_rate = max_error_rate if max_error_rate is not None else Config.LLM_MAX_ERROR_RATE
+        self.max_latency = max_latency if max_latency is not None else Config.LLM_MAX_LATENCY
+        self.min_calls = min_calls if min_calls is not None else Config.LLM_HEALTH_MIN_CALLS
+        self.sample_ttl = sample_ttl if sample_ttl is not None else Config.LLM_HEALTH_TTL
+        self.clock = clock
+        self._history = {}
+        self._lock = threading.Lock()
+
+    def score_request(self, brief, attachments, checks):
+        """Score how demanding a request is from its brief, attachments and checks"""
+        score = len((brief or "").split()) / 25.0
+
+        for attachment in attachments or []:
+            score += 1
+            url = attachment.get("url", "") if isinstance(attachment, dict) else str(attachment)
+            # Base64 data URIs grow by 4/3, so this approximates the decoded size
+            size_kb = len(url) * 3 / 4 / 1024
+            score += min(size_kb / 50.0, 3)
+
+        score += len(checks or []) * 0.5
+        return score
+
+    def select_tier(self, brief, attachments, checks):
+        """Pick the tier for a request, failing over when the preferred tier is degraded"""
+        score = self.score_request(brief, attachments, checks)
+        preferred = "capable" if score >= self.threshold else "fast"
+        fallback = "fast" if preferred == "capable" else "capable"
+
+        if self.is_degraded(self.tiers[preferred]) and not self.is_degraded(self.tiers[fallback]):
+            print(f"⚠️ {self.tiers[preferred]} degraded, failing over to {self.tiers[fallback]}")
+            return fallback, score
+        return preferred, score
+
+    def route(self, brief, attachments, checks):
+        """Return models to try in order: the selected tier first, then the other one"""
+        tier, score = self.select_tier(brief, attachments, checks)
+        other = "fast" if tier == "capable" else "capable"
+        models = [self.tiers[tier]]
+        if self.tiers[other] != models[0]:
+            models.append(self.tiers[other])
+        print(f"🧭 Complexity score {score:.1f} -> {tier} tier ({models[0]})")
+        return models
+
+    def record_result(self, model, latency, outcome="ok"):
+        """Record the latency and outcome ("ok", "error" or "bad_output") of a call"""
+        with self._lock:
+            history = self._history.setdefault(model, deque(maxlen=self.window))
+            history.append((self.clock(), latency, outcome))
+
+    def get_stats(self, model):
+        """Rolling latency, error rate and bad output rate for a model"""
+        with self._lock:
+            history = self._history.get(model)
+            # Expire old samples so a degraded model is tried again later
+            cutoff = self.clock() - self.sample_ttl
+            while history and history[0][0] < cutoff:
+                history.popleft()
+            samples = list(history or [])
+
+        if not samples:
+            return {"calls": 0, "avg_latency": 0.0, "error_rate": 0.0, "bad_output_rate": 0.0}
+
+        # Failed calls can return quickly, so only answered calls count towards latency
+        answered = [latency for _, latency, outcome in samples if outcome != "error"]
+        return {
+            "calls": len(samples),
+            "avg_latency": sum(answered) / len(answered) if answered else 0.0,
+            "error_rate": sum(1 for _, _, outcome in samples if outcome == "error") / len(samples),
+            "bad_output_rate": sum(1 for _, _, outcome in samples if outcome == "bad_output") / len(samples)
+        }
+
+    def latency_limit(self, model):
+        """Latency limit for a model, taken from the tiers it serves"""
+        limits = [self.max_latency[tier] for tier, name in self.tiers.items() if name == model]
+        return max(limits or self.max_latency.values())
+
+    def is_degraded(self, model):
+        """Check whether a model's recent latency or error rate exceeds the limits"""
+        stats = self.get_stats(model)
+        if stats["calls"] < self.min_calls:
+            return False
+        return stats["error_rate"] > self.max_error_rate or stats["avg_latency"] > self.latency_limit(model)
+
+    def timed_call(self, model, func):
+        """Run func(model), recording its latency and whether it failed"""
+        start = time.monotonic()
+        try:
+            result = func(model)
+        except ModelOutputError:
+            # The model answered; unusable output says nothing about its availability
+            self.record_result(model, time.monotonic() - start, "bad_output")
+            raise
+        except Exception:
+            self.record_result(model, time.monotonic() - start, "error")
+            raise
+        self.record_result(model, time.monotonic() - start, "ok")
+        return result
+
+# Shared across generator instances so health stats survive between builds
+model_router = ModelRouter()
@@ -0,0 +1,123 @@
+import base64
+import json
+import pytest
+
+openai = pytest.importorskip("openai")
+
+from llm_generator import LLMAppGenerator
+from model_router import ModelOutputError
+
+APP_JSON = json.dumps({"files": {"index.html": "<h1>App</h1>", "README.md": "# App"}, "explanation": "ok"})
+
+class StubRouter:
+    def __init__(self, models):
+        self.models = models
+        self.called = []
+
+    def route(self, brief, attachments, checks):
+        return list(self.models)
+
+    def timed_call(self, model, func):
+        self.called.append(model)
+        return func(model)
+
+class FakeResponse:
+    def __init__(self, content):
+        message = type("Message", (), {"content": content})()
+        self.choices = [type("Choice", (), {"message": message})()]
+
+def fake_completion(replies, calls):
+    """Build a ChatCompletion.create replacement that answers or raises per model"""
+    def create(model, messages, **kwargs):
+        calls.append((model, messages[0]["content"]))
+        reply = replies[model]
+        if isinstance(reply, Exception):
+            raise reply
+        return FakeResponse(reply)
+    return create
+
+@pytest.fixture
+def with_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+def test_no_api_key_returns_demo_app(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    router = StubRouter(["fast-model", "capable-model"])
+    generator = LLMAppGenerator(router)
+
+    app = generator.generate_app("make a counter", [], [])
+
+    assert app == generator._get_demo_app("make a counter")
+    assert router.called == []
+
+def test_models_are_tried_in_route_order(monkeypatch, with_key):
+    calls = []
+    monkeypatch.setattr(openai.ChatCompletion, "create",
+                        fake_completion({"capable-model": APP_JSON, "fast-model": APP_JSON}, calls))
+    router = StubRouter(["capable-model", "fast-model"])
+
+    app = LLMAppGenerator(router).generate_app("build a dashboard", [], [])
+
+    assert app["files"]["index.html"] == "<h1>App</h1>"
+    assert [model for model, _ in calls] == ["capable-model"]
+
+def test_second_model_used_when_first_fails(monkeypatch, with_key):
+    calls = []
+    replies = {"fast-model": TimeoutError("timed out"), "capable-model": APP_JSON}
+    monkeypatch.setattr(openai.ChatCompletion, "create", fake_completion(replies, calls))
+    router = StubRouter(["fast-model", "capable-model"])
+
+    app = LLMAppGenerator(router).generate_app("make a counter", [], [])
+
+    assert app["explanation"] == "ok"
+    assert router.called == ["fast-model", "capable-model"]
+
+def test_demo_app_returned_when_all_models_fail(monkeypatch, with_key):
+    calls = []
+    replies = {"fast-model": TimeoutError("timed out"), "capable-model": "not json"}
+    monkeypatch.setattr(openai.ChatCompletion, "create", fake_completion(replies, calls))
+    generator = LLMAppGenerator(StubRouter(["fast-model", "capable-model"]))
+
+    app = generator.generate_app("make a counter", [], [])
+
+    assert app == generator._get_demo_app("make a counter")
+    assert len(calls) == 2
+
+def test_prompt_includes_text_attachment_preview(monkeypatch, with_key):
+    calls = []
+    monkeypatch.setattr(openai.ChatCompletion, "create", fake_completion({"fast-model": APP_JSON}, calls))
+    csv = base64.b64encode(b"city,sales\nParis,42\n").decode()
+    attachments = [
+        {"name": "data.csv", "url": "data:text/csv;base64," + csv},
+        {"name": "logo.png", "url": "data:image/png;base64,iVBORw0KGgo="}
+    ]
+
+    LLMAppGenerator(StubRouter(["fast-model"])).generate_app("chart sales", attachments, [])
+
+    prompt = calls[0][1]
+    assert "Paris,42" in prompt
+    assert "logo.png (image/png, 8 bytes, not shown)" in prompt
+
+def test_parse_accepts_fenced_json():
+    app = LLMAppGenerator(StubRouter([]))._parse_app_json("Here you go:\n```json\n" + APP_JSON + "\n```")
+    assert app["files"]["README.md"] == "# App"
+
+@pytest.mark.parametrize("content", [
+    "Sorry, I can't help with that.",
+    "```json\n{\"files\": {\"index.html\": \n```",
+    json.dumps({"files": {"README.md": "# App"}})
+])
+def test_parse_rejects_unusable_output(content):
+    with pytest.raises(ModelOutputError):
+        LLMAppGenerator(StubRouter([]))._parse_app_json(content)
+
+def test_app_generator_falls_back_to_simple_app(monkeypatch):
+    pytest.importorskip("flask")
+    pytest.importorskip("github")
+    pytest.importorskip("requests")
+    import app as service
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    generator = service.LLMAppGenerator(StubRouter(["fast-model"]))
+
+    assert generator.generate_app("make a counter", [], []) == generator._create_simple_app("make a counter")
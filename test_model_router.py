@@ -0,0 +1,142 @@
+import pytest
+from model_router import ModelRouter, ModelOutputError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_router(clock=None, **kwargs):
+    settings = {
+        "tiers": {"fast": "fast-model", "capable": "capable-model"},
+        "threshold": 5,
+        "window": 10,
+        "max_error_rate": 0.5,
+        "max_latency": {"fast": 30, "capable": 90},
+        "min_calls": 3,
+        "sample_ttl": 300,
+        "clock": clock or FakeClock()
+    }
+    settings.update(kwargs)
+    return ModelRouter(**settings)
+
+def complex_request():
+    attachment = {"name": "data.csv", "url": "data:text/csv;base64," + "A" * 100000}
+    return "build a dashboard " * 20, [attachment], ["check"] * 4
+
+def test_score_grows_with_brief_attachments_and_checks():
+    router = make_router()
+    simple = router.score_request("make a counter", [], [])
+    assert simple < router.score_request("make a counter", [], ["check"])
+    assert simple < router.score_request("make a counter", [{"name": "a.txt", "url": ""}], [])
+    assert simple < router.score_request("make a counter " * 50, [], [])
+
+def test_routes_by_complexity():
+    router = make_router()
+    assert router.route("make a counter", [], []) == ["fast-model", "capable-model"]
+    assert router.route(*complex_request()) == ["capable-model", "fast-model"]
+
+def test_identical_tier_models_are_tried_once():
+    router = make_router(tiers={"fast": "same-model", "capable": "same-model"})
+    assert router.route(*complex_request()) == ["same-model"]
+
+def test_degraded_tier_fails_over():
+    router = make_router()
+    for _ in range(3):
+        router.record_result("capable-model", 1.0, "error")
+    assert router.is_degraded("capable-model")
+    assert router.route(*complex_request())[0] == "fast-model"
+
+def test_not_degraded_below_min_calls():
+    router = make_router(min_calls=5)
+    for _ in range(4):
+        router.record_result("capable-model", 1.0, "error")
+    assert not router.is_degraded("capable-model")
+
+def test_slow_model_is_degraded():
+    router = make_router()
+    for _ in range(3):
+        router.record_result("fast-model", 45.0)
+    assert router.is_degraded("fast-model")
+    assert router.route("make a counter", [], [])[0] == "capable-model"
+
+def test_fast_errors_do_not_hide_slow_answers():
+    router = make_router(max_error_rate=0.9)
+    for _ in range(3):
+        router.record_result("fast-model", 45.0)
+    for _ in range(5):
+        router.record_result("fast-model", 0.1, "error")
+    assert router.get_stats("fast-model")["avg_latency"] == 45.0
+    assert router.is_degraded("fast-model")
+
+def test_latency_limit_is_per_tier():
+    router = make_router()
+    for _ in range(3):
+        router.record_result("capable-model", 45.0)
+    assert not router.is_degraded("capable-model")
+    assert router.route(*complex_request())[0] == "capable-model"
+
+def test_shared_model_uses_most_lenient_latency_limit():
+    router = make_router(tiers={"fast": "same-model", "capable": "same-model"})
+    assert router.latency_limit("same-model") == 90
+
+def test_no_failover_when_both_tiers_degraded():
+    router = make_router()
+    for model in ("fast-model", "capable-model"):
+        for _ in range(3):
+            router.record_result(model, 1.0, "error")
+    assert router.route(*complex_request())[0] == "capable-model"
+
+def test_degraded_model_recovers_after_samples_expire():
+    clock = FakeClock()
+    router = make_router(clock=clock)
+    for _ in range(3):
+        router.record_result("capable-model", 1.0, "error")
+    for _ in range(100):
+        router.record_result("fast-model", 1.0)
+    assert router.route(*complex_request())[0] == "fast-model"
+
+    clock.now += 301
+    assert router.get_stats("capable-model")["calls"] == 0
+    assert router.route(*complex_request())[0] == "capable-model"
+
+def test_window_keeps_only_recent_calls():
+    router = make_router(window=4)
+    for _ in range(4):
+        router.record_result("fast-model", 1.0, "error")
+    for _ in range(4):
+        router.record_result("fast-model", 1.0)
+    stats = router.get_stats("fast-model")
+    assert stats["calls"] == 4
+    assert stats["error_rate"] == 0.0
+
+def test_timed_call_records_success_and_errors():
+    router = make_router()
+    assert router.timed_call("fast-model", lambda model: model + " ok") == "fast-model ok"
+
+    def fail(model):
+        raise TimeoutError("timed out")
+
+    with pytest.raises(TimeoutError):
+        router.timed_call("fast-model", fail)
+
+    stats = router.get_stats("fast-model")
+    assert stats["calls"] == 2
+    assert stats["error_rate"] == 0.5
+
+def test_bad_output_does_not_degrade_model():
+    router = make_router()
+
+    def bad_output(model):
+        raise ModelOutputError("not json")
+
+    for _ in range(5):
+        with pytest.raises(ModelOutputError):
+            router.timed_call("fast-model", bad_output)
+
+    stats = router.get_stats("fast-model")
+    assert stats["bad_output_rate"] == 1.0
+    assert stats["error_rate"] == 0.0
+    assert not router.is_degraded("fast-model")